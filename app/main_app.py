@@ -16,7 +16,7 @@ sys.path.append(PROJECT_ROOT)
 
 try:
     # Relative imports from the 'src' package
-    from src import nlp_processing, recommender, forecasting, data_pipeline, database, utils
+    from src import nlp_processing, recommender, forecasting, data_pipeline, database, utils, snapshots
 except ImportError as e:
     st.error(f"Failed to import source modules. Ensure 'src' directory contains __init__.py. Error: {e}")
     st.stop()
@@ -25,6 +25,9 @@ except ImportError as e:
 utils.initialize_data_files()
 database.init_db()
 
+# Keep the dashboard snapshot fresh in the background (started once per process)
+snapshots.start_scheduler()
+
 # -------------------------------
 # Session State Management
 # -------------------------------
@@ -140,33 +143,38 @@ elif page == "Job Trend Tracker":
     st.markdown("---")
     st.subheader("Previously Fetched Jobs Data")
     
-    prev_jobs = utils.load_jobs()
-    if not prev_jobs.empty:
+    jobs_snapshot = snapshots.get_snapshot()["jobs"]
+    if jobs_snapshot["records"]:
+        prev_jobs = pd.DataFrame(jobs_snapshot["records"])
         st.dataframe(prev_jobs, use_container_width=True)
 
         # ----- Trend Forecasting -----
         st.subheader("Simulated Skill Demand Trend")
         
-        # Use one of the most common skills from the scraped jobs, or default
-        all_descriptions = ' '.join(prev_jobs['description'].fillna(''))
-        # Use nlp_processing to find a skill in the scraped data descriptions
-        scraped_skills = nlp_processing.extract_skills(all_descriptions)
-        skill_to_forecast = scraped_skills[0] if scraped_skills else keyword.title()
-        
-        st.info(f"Generating a 60-day trend simulation for the skill: **{skill_to_forecast}**")
+        # Use one of the skills precomputed from the scraped jobs, or default
+        skill_to_forecast = jobs_snapshot["forecast_skill"] or keyword.title()
         
-        df_forecast = forecasting.forecast_skill_trend(skill_to_forecast)
-        
-        # Plotly chart for professional look
-        fig = px.line(
-            df_forecast, 
-            x="date", 
-            y="Trend Score", 
-            title=f"60-Day Simulated Demand Trend for {skill_to_forecast}",
-            labels={"Trend Score": "Relative Demand Score (0-100)"},
-            template="plotly_dark"
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        if not snapshots.TREND_AVAILABLE:
+            st.warning("Trend forecasting is unavailable: `forecast_skill_trend` is not implemented in `src/forecasting.py`.")
+        else:
+            st.info(f"Generating a 60-day trend simulation for the skill: **{skill_to_forecast}**")
+            
+            # The snapshot only holds the trend for the precomputed skill; the keyword fallback is computed live
+            if jobs_snapshot["trend"]:
+                df_forecast = pd.DataFrame(jobs_snapshot["trend"])
+            else:
+                df_forecast = forecasting.forecast_skill_trend(skill_to_forecast)
+            
+            # Plotly chart for professional look
+            fig = px.line(
+                df_forecast, 
+                x="date", 
+                y="Trend Score", 
+                title=f"60-Day Simulated Demand Trend for {skill_to_forecast}",
+                labels={"Trend Score": "Relative Demand Score (0-100)"},
+                template="plotly_dark"
+            )
+            st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No job data found. Click 'Fetch & Analyze Jobs' to get started.")
 
@@ -176,21 +184,20 @@ elif page == "Job Trend Tracker":
 elif page == "Analysis History":
     st.header("Analysis History")
     
-    history_df = database.load_history()
+    history_snapshot = snapshots.get_snapshot()["history"]
     
-    if history_df is None or history_df.empty:
+    if not history_snapshot["total"]:
         st.info("No previous analysis records found. Run a skill analysis first!")
     else:
-        st.subheader(f"Total Records: {len(history_df)}")
+        st.subheader(f"Total Records: {history_snapshot['total']}")
         
-        # Prepare for display
-        display_df = history_df[['timestamp', 'extracted_skills', 'recommendations', 'input_text']].copy()
+        # Recent records are precomputed (already truncated) by the snapshot job
+        display_df = pd.DataFrame(history_snapshot["recent"], columns=['timestamp', 'extracted_skills', 'recommendations', 'input_preview'])
         display_df.columns = ['Timestamp', 'Extracted Skills', 'Recommended Gaps', 'Input Text Preview']
         
-        # Truncate text for cleaner display
-        display_df['Input Text Preview'] = display_df['Input Text Preview'].str.slice(0, 100) + '...'
-        
         st.dataframe(display_df, use_container_width=True)
+        if history_snapshot["total"] > len(display_df):
+            st.caption(f"Showing the {len(display_df)} most recent records.")
         
         st.markdown("---")
         st.caption("Detailed history is stored locally in `data/skills.db`.")
@@ -126,3 +126,53 @@ def load_history():
         if conn:
             conn.close()
     return df
+
+def get_history_latest_id():
+    """Returns the latest history id (0 if empty). Rows are only ever appended, so this is a cheap change marker."""
+    conn = None
+    latest_id = 0
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cur = conn.cursor()
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM history")
+        latest_id = cur.fetchone()[0]
+    except Exception as e:
+        print(f"Error reading latest history id: {e}")
+    finally:
+        if conn:
+            conn.close()
+    return latest_id
+
+def get_history_count():
+    """Returns the total number of history records."""
+    conn = None
+    count = 0
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        cur = conn.cursor()
+        cur.execute("SELECT COUNT(*) FROM history")
+        count = cur.fetchone()[0]
+    except Exception as e:
+        print(f"Error counting history records: {e}")
+    finally:
+        if conn:
+            conn.close()
+    return count
+
+def load_recent_history(limit: int = 100):
+    """Loads only the most recent analysis records into a pandas DataFrame."""
+    conn = None
+    df = pd.DataFrame(columns=['id', 'timestamp', 'input_text', 'extracted_skills', 'recommendations'])
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        df = pd.read_sql_query("SELECT * FROM history ORDER BY id DESC LIMIT ?", conn, params=(limit,))
+        df['extracted_skills'] = df['extracted_skills'].apply(json.loads)
+        df['recommendations'] = df['recommendations'].apply(json.loads)
+    except pd.io.sql.DatabaseError:
+        pass
+    except Exception as e:
+        print(f"Error loading recent history: {e}")
+    finally:
+        if conn:
+            conn.close()
+    return df
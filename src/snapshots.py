@@ -0,0 +1,211 @@
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from . import utils, database, nlp_processing, forecasting # Use relative import
+
+# Precomputed aggregates for the "Job Trend Tracker" and "Analysis History" pages.
+# Each section is keyed by its own data version (jobs file metadata, latest history id),
+# so the pages render from one small JSON file and only the section whose data changed is rebuilt.
+SNAPSHOT_FILE = os.path.join(utils.DATA_DIR, "dashboard_snapshot.json")
+HISTORY_PAGE_SIZE = 100
+PREVIEW_LENGTH = 100
+REFRESH_INTERVAL_SECONDS = 60
+
+# forecast_skill_trend is not implemented in every checkout; the trend series is skipped when it is missing.
+TREND_AVAILABLE = hasattr(forecasting, "forecast_skill_trend")
+
+_refresh_lock = threading.Lock()
+_scheduler_thread = None
+
+
+def get_jobs_version():
+    """Version key for the jobs section, from the jobs file metadata (the file itself is not read)."""
+    try:
+        stat = os.stat(utils.JOBS_FILE)
+        return f"jobs:{stat.st_mtime_ns}-{stat.st_size}"
+    except OSError:
+        return "jobs:none"
+
+
+def get_history_version():
+    """Version key for the history section. History rows are append-only, so the latest id is enough."""
+    return f"history:{database.get_history_latest_id()}"
+
+
+def get_data_versions():
+    """Current version key of every snapshot section."""
+    return {"jobs": get_jobs_version(), "history": get_history_version()}
+
+
+def _build_jobs_section():
+    """Aggregate the data needed by the Job Trend Tracker page."""
+    jobs_df = utils.load_jobs()
+    if jobs_df.empty:
+        return {"records": [], "skills": [], "forecast_skill": None, "trend": None}
+
+    all_descriptions = ' '.join(jobs_df['description'].fillna(''))
+    skills = nlp_processing.extract_skills(all_descriptions)
+    forecast_skill = skills[0] if skills else None
+
+    trend = None
+    if forecast_skill and TREND_AVAILABLE:
+        df_forecast = forecasting.forecast_skill_trend(forecast_skill)
+        trend = json.loads(df_forecast.to_json(orient="records", date_format="iso"))
+
+    return {
+        "records": json.loads(jobs_df.to_json(orient="records")),
+        "skills": skills,
+        "forecast_skill": forecast_skill,
+        "trend": trend,
+    }
+
+
+def _build_history_section():
+    """Aggregate the data needed by the Analysis History page."""
+    recent_df = database.load_recent_history(HISTORY_PAGE_SIZE)
+
+    records = []
+    for _, row in recent_df.iterrows():
+        records.append({
+            "timestamp": row['timestamp'],
+            "extracted_skills": row['extracted_skills'],
+            "recommendations": row['recommendations'],
+            "input_preview": (row['input_text'] or '')[:PREVIEW_LENGTH] + '...',
+        })
+    return {"total": database.get_history_count(), "recent": records}
+
+
+SECTION_BUILDERS = {
+    "jobs": _build_jobs_section,
+    "history": _build_history_section,
+}
+
+
+def build_snapshot(previous=None, versions=None, force: bool = False):
+    """
+    Compute the dashboard snapshot for the given (or current) data versions.
+    Sections whose version matches the previous snapshot are reused as-is.
+    """
+    versions = versions or get_data_versions()
+    previous = previous or {}
+    previous_versions = previous.get("versions", {})
+
+    snapshot = {"versions": versions, "created_at": datetime.now().isoformat()}
+    for name, builder in SECTION_BUILDERS.items():
+        if not force and name in previous and previous_versions.get(name) == versions[name]:
+            snapshot[name] = previous[name]
+        else:
+            snapshot[name] = builder()
+    return snapshot
+
+
+def is_current(snapshot, versions=None):
+    """True if every section of the snapshot matches the current data versions."""
+    return bool(snapshot) and snapshot.get("versions") == (versions or get_data_versions())
+
+
+def load_snapshot():
+    """Load the stored snapshot, or None if it is missing or unreadable."""
+    if not os.path.exists(SNAPSHOT_FILE):
+        return None
+    try:
+        with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def save_snapshot(snapshot: dict):
+    """
+    Write the snapshot to a unique temp file and atomically swap it in,
+    so concurrent writers (app thread, cron, --watch) never mix their output.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(SNAPSHOT_FILE), prefix="dashboard_snapshot.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
+        os.replace(tmp_path, SNAPSHOT_FILE)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def refresh_snapshot(force: bool = False, blocking: bool = True):
+    """
+    Rebuild the stale sections of the snapshot (or all of them if forced) and return it.
+    With blocking=False, returns the stored snapshot untouched if a rebuild is already running.
+    """
+    if not _refresh_lock.acquire(blocking=blocking):
+        return load_snapshot()
+    try:
+        versions = get_data_versions()
+        previous = load_snapshot()
+        if not force and is_current(previous, versions):
+            return previous
+        snapshot = build_snapshot(previous, versions, force)
+        try:
+            save_snapshot(snapshot)
+        except Exception as e:
+            print(f"Error saving dashboard snapshot: {e}")
+        return snapshot
+    finally:
+        _refresh_lock.release()
+
+
+def get_snapshot():
+    """
+    Return the snapshot for page rendering.
+    Serves the stored snapshot (even if stale) while another rebuild is running;
+    only blocks when no snapshot exists yet.
+    """
+    snapshot = load_snapshot()
+    if snapshot is None:
+        return refresh_snapshot()
+    if is_current(snapshot):
+        return snapshot
+    return refresh_snapshot(blocking=False) or snapshot
+
+
+def _scheduler_loop(interval: int):
+    while True:
+        try:
+            refresh_snapshot()
+        except Exception as e:
+            print(f"Error in snapshot scheduler: {e}")
+        time.sleep(interval)
+
+
+def start_scheduler(interval: int = REFRESH_INTERVAL_SECONDS):
+    """Start the background refresh thread once per process. Safe to call on every rerun."""
+    global _scheduler_thread
+    if _scheduler_thread is not None and _scheduler_thread.is_alive():
+        return _scheduler_thread
+    _scheduler_thread = threading.Thread(target=_scheduler_loop, args=(interval,), daemon=True, name="snapshot-refresh")
+    _scheduler_thread.start()
+    return _scheduler_thread
+
+
+def main(argv=None):
+    """Cron target: refresh the snapshot once, or keep refreshing with --watch."""
+    parser = argparse.ArgumentParser(description="Refresh the precomputed dashboard snapshot.")
+    parser.add_argument("--watch", type=int, nargs="?", const=REFRESH_INTERVAL_SECONDS, default=None,
+                        metavar="SECONDS", help=f"keep refreshing every SECONDS (default {REFRESH_INTERVAL_SECONDS})")
+    parser.add_argument("--force", action="store_true", help="rebuild every section even if its data is unchanged")
+    args = parser.parse_args(argv)
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch interval must be a positive number of seconds")
+
+    if args.watch is not None:
+        _scheduler_loop(args.watch)
+    else:
+        result = refresh_snapshot(force=args.force)
+        print(f"Dashboard snapshot ready (versions {result['versions']}).")
+
+
+if __name__ == "__main__":
+    main()
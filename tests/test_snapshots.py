@@ -0,0 +1,104 @@
+import os
+import sys
+import pandas as pd
+import pytest
+
+# Make the 'src' package importable when running pytest from any directory
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(PROJECT_ROOT)
+
+from src import database, snapshots, utils
+
+
+@pytest.fixture
+def isolated_data(tmp_path, monkeypatch):
+    """Point the jobs file, history database and snapshot file at a temp directory."""
+    monkeypatch.setattr(utils, "JOBS_FILE", str(tmp_path / "jobs_db.json"))
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "skills.db"))
+    monkeypatch.setattr(snapshots, "SNAPSHOT_FILE", str(tmp_path / "dashboard_snapshot.json"))
+    database.init_db()
+    return tmp_path
+
+
+@pytest.fixture
+def build_calls(monkeypatch):
+    """Count how often each snapshot section is rebuilt."""
+    calls = {name: 0 for name in snapshots.SECTION_BUILDERS}
+    for name, builder in list(snapshots.SECTION_BUILDERS.items()):
+        def counted(name=name, builder=builder):
+            calls[name] += 1
+            return builder()
+        monkeypatch.setitem(snapshots.SECTION_BUILDERS, name, counted)
+    return calls
+
+
+def _save_sample_jobs(description="Needs Python and SQL."):
+    utils.save_jobs(pd.DataFrame([{
+        "title": "Data Scientist", "company": "TechCorp", "location": "Remote",
+        "description": description, "url": "https://example.com/jobs",
+    }]))
+
+
+def test_snapshot_reused_while_versions_unchanged(isolated_data, build_calls):
+    _save_sample_jobs()
+    database.save_analysis("I know Python", ["Python"], ["SQL"])
+
+    first = snapshots.get_snapshot()
+    second = snapshots.get_snapshot()
+
+    assert build_calls == {"jobs": 1, "history": 1}
+    assert second == first
+
+
+def test_save_analysis_rebuilds_only_history(isolated_data, build_calls):
+    _save_sample_jobs()
+    snapshots.get_snapshot()
+
+    database.save_analysis("I know Python", ["Python"], ["SQL"])
+    snapshot = snapshots.get_snapshot()
+
+    assert build_calls == {"jobs": 1, "history": 2}
+    assert snapshot["history"]["total"] == 1
+    assert snapshot["history"]["recent"][0]["extracted_skills"] == ["Python"]
+
+
+def test_save_jobs_rebuilds_only_jobs(isolated_data, build_calls):
+    _save_sample_jobs()
+    database.save_analysis("I know Python", ["Python"], ["SQL"])
+    snapshots.get_snapshot()
+
+    _save_sample_jobs("Seeking expert in Docker, Linux, and AWS.")
+    snapshot = snapshots.get_snapshot()
+
+    assert build_calls == {"jobs": 2, "history": 1}
+    assert "Docker" in snapshot["jobs"]["skills"]
+
+
+def test_recent_history_capped_at_page_size(isolated_data, monkeypatch):
+    monkeypatch.setattr(snapshots, "HISTORY_PAGE_SIZE", 3)
+    for i in range(5):
+        database.save_analysis(f"profile {i}", [], [])
+
+    history = snapshots.get_snapshot()["history"]
+
+    assert history["total"] == 5
+    assert len(history["recent"]) == 3
+    assert history["recent"][0]["input_preview"].startswith("profile 4")
+
+
+def test_get_snapshot_serves_stale_while_rebuild_running(isolated_data, build_calls):
+    snapshots.get_snapshot()
+    database.save_analysis("I know Python", ["Python"], ["SQL"])
+
+    with snapshots._refresh_lock:
+        stale = snapshots.get_snapshot()
+
+    assert stale["history"]["total"] == 0
+    assert build_calls == {"jobs": 1, "history": 1}
+
+
+def test_cli_rejects_invalid_watch_interval(isolated_data):
+    with pytest.raises(SystemExit):
+        snapshots.main(["--watch", "1m"])
+    with pytest.raises(SystemExit):
+        snapshots.main(["--unknown"])